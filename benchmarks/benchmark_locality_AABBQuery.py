@@ -15,13 +15,18 @@ class BenchmarkLocalityAABBQuery(Benchmark):
 
     def bench_setup(self, N):
         self.box = freud.box.Box.cube(self.L)
-        seed = 0
-        np.random.seed(seed)
-        self.points = np.random.uniform(-self.L / 2, self.L / 2, (N, 3))
+        rng = np.random.default_rng(0)
+        # Generate float32 points directly so that queries do not need to
+        # convert the array on every call.
+        self.points = rng.random((N, 3), dtype=np.float32) * self.L - self.L / 2
+        # The tree only depends on the points, so build it once and let
+        # bench_run measure the repeated queries against it.
+        self.aq = freud.locality.AABBQuery(self.box, self.points)
 
     def bench_run(self, N):
-        aq = freud.locality.AABBQuery(self.box, self.points)
-        aq.query(self.points, {"r_max": self.r_max, "exclude_ii": True})
+        # Query results are evaluated lazily, so the neighbor list must be
+        # built for the query itself to be timed.
+        self.aq.query_self({"r_max": self.r_max}).toNeighborList()
 
 
 def run():
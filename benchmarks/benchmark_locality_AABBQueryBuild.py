@@ -0,0 +1,34 @@
+# Copyright (c) 2010-2024 The Regents of the University of Michigan
+# This file is from the freud project, released under the BSD 3-Clause License.
+
+import numpy as np
+from benchmark import Benchmark
+from benchmarker import run_benchmarks
+
+import freud
+
+
+class BenchmarkLocalityAABBQueryBuild(Benchmark):
+    def __init__(self, L):
+        self.L = L
+
+    def bench_setup(self, N):
+        self.box = freud.box.Box.cube(self.L)
+        rng = np.random.default_rng(0)
+        self.points = rng.random((N, 3), dtype=np.float32) * self.L - self.L / 2
+
+    def bench_run(self, N):
+        freud.locality.AABBQuery(self.box, self.points)
+
+
+def run():
+    Ns = [1000, 10000]
+    L = 10
+    number = 100
+
+    name = "freud.locality.AABBQuery build"
+    return run_benchmarks(name, Ns, number, BenchmarkLocalityAABBQueryBuild, L=L)
+
+
+if __name__ == "__main__":
+    run()
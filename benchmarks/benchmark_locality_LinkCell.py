@@ -15,8 +15,8 @@ class BenchmarkLocalityLinkCell(Benchmark):
 
     def bench_setup(self, N):
         self.box = freud.box.Box.cube(self.L)
-        np.random.seed(0)
-        self.points = np.random.uniform(-self.L / 2, self.L / 2, (N, 3))
+        rng = np.random.default_rng(0)
+        self.points = rng.uniform(-self.L / 2, self.L / 2, (N, 3))
 
     def bench_run(self, N):
         lc = freud.locality.LinkCell(self.box, self.points)
@@ -6,6 +6,7 @@
 
 #include "utils.h"
 #include <algorithm>
+#include <cmath>
 #include <complex>
 #include <sstream>
 #include <stdexcept>
@@ -232,7 +233,7 @@ public:
      */
     void makeAbsolute(const vec3<float>* vecs, unsigned int Nvecs, vec3<float>* out) const
     {
-        util::forLoopWrapper(0, Nvecs, [&](size_t begin, size_t end) {
+        forEachVector(Nvecs, [&](size_t begin, size_t end) {
             for (size_t i = begin; i < end; ++i)
             {
                 out[i] = makeAbsolute(vecs[i]);
@@ -265,7 +266,7 @@ public:
      */
     void makeFractional(const vec3<float>* vecs, unsigned int Nvecs, vec3<float>* out) const
     {
-        util::forLoopWrapper(0, Nvecs, [&](size_t begin, size_t end) {
+        forEachVector(Nvecs, [&](size_t begin, size_t end) {
             for (size_t i = begin; i < end; ++i)
             {
                 out[i] = makeFractional(vecs[i]);
@@ -296,7 +297,7 @@ public:
      */
     void getImages(vec3<float>* vecs, unsigned int Nvecs, vec3<int>* res) const
     {
-        util::forLoopWrapper(0, Nvecs, [&](size_t begin, size_t end) {
+        forEachVector(Nvecs, [&](size_t begin, size_t end) {
             for (size_t i = begin; i < end; ++i)
             {
                 getImage(vecs[i], res[i]);
@@ -316,20 +317,7 @@ public:
             return v;
         }
 
-        vec3<float> v_frac = makeFractional(v);
-        if (m_periodic.x)
-        {
-            v_frac.x = util::modulusPositive(v_frac.x, float(1.0));
-        }
-        if (m_periodic.y)
-        {
-            v_frac.y = util::modulusPositive(v_frac.y, float(1.0));
-        }
-        if (m_periodic.z)
-        {
-            v_frac.z = util::modulusPositive(v_frac.z, float(1.0));
-        }
-        return makeAbsolute(v_frac);
+        return wrapMasked(v, getPeriodicMask());
     }
 
     //! Wrap vectors back into the box in place
@@ -339,10 +327,23 @@ public:
      */
     void wrap(const vec3<float>* vecs, unsigned int Nvecs, vec3<float>* out) const
     {
-        util::forLoopWrapper(0, Nvecs, [&](size_t begin, size_t end) {
+        // Return quickly if the box is aperiodic
+        if (!m_periodic.x && !m_periodic.y && !m_periodic.z)
+        {
+            if (out != vecs)
+            {
+                std::copy(vecs, vecs + Nvecs, out);
+            }
+            return;
+        }
+
+        // Hoist the periodicity checks out of the loop so that the loop body
+        // is the same straight-line arithmetic for every vector.
+        const vec3<float> periodic = getPeriodicMask();
+        forEachVector(Nvecs, [&](size_t begin, size_t end) {
             for (size_t i = begin; i < end; ++i)
             {
-                out[i] = wrap(vecs[i]);
+                out[i] = wrapMasked(vecs[i], periodic);
             }
         });
     }
@@ -355,7 +356,7 @@ public:
     */
     void unwrap(const vec3<float>* vecs, const vec3<int>* images, unsigned int Nvecs, vec3<float>* out) const
     {
-        util::forLoopWrapper(0, Nvecs, [&](size_t begin, size_t end) {
+        forEachVector(Nvecs, [&](size_t begin, size_t end) {
             for (size_t i = begin; i < end; ++i)
             {
                 out[i] = vecs[i] + getLatticeVector(0) * float(images[i].x)
@@ -404,7 +405,7 @@ public:
     void center(vec3<float>* vecs, unsigned int Nvecs, const float* masses = nullptr) const
     {
         vec3<float> com(centerOfMass(vecs, Nvecs, masses));
-        util::forLoopWrapper(0, Nvecs, [&](size_t begin, size_t end) {
+        forEachVector(Nvecs, [&](size_t begin, size_t end) {
             for (size_t i = begin; i < end; ++i)
             {
                 vecs[i] = wrap(vecs[i] - com);
@@ -597,6 +598,54 @@ public:
     }
 
 private:
+    //! Minimum number of vectors for which the array helpers are run in parallel
+    static constexpr unsigned int MIN_PARALLEL_VECTORS = 1024;
+
+    //! Loop over an array of vectors
+    /*! Small arrays are processed serially, since dispatching them through
+     *  TBB costs more than the arithmetic itself.
+     *  \param Nvecs Number of vectors
+     *  \param body An object with operator(size_t begin, size_t end).
+     */
+    template<typename Body> static void forEachVector(unsigned int Nvecs, const Body& body)
+    {
+        util::forLoopWrapper(0, Nvecs, body, Nvecs >= MIN_PARALLEL_VECTORS);
+    }
+
+    //! Get the number of box lengths to subtract to wrap a fractional coordinate into [0, 1)
+    /*! \param f Fractional coordinate.
+     *  \returns The image offset of f.
+     */
+    static float wrapImage(float f)
+    {
+        const float image = std::floor(f);
+        // f - floor(f) can round up to exactly 1 for tiny negative f.
+        return (f - image < float(1.0)) ? image : image + float(1.0);
+    }
+
+    //! Get the periodicity of the box as 0/1 factors for each direction
+    vec3<float> getPeriodicMask() const
+    {
+        return {static_cast<float>(m_periodic.x), static_cast<float>(m_periodic.y),
+                static_cast<float>(m_periodic.z)};
+    }
+
+    //! Wrap a vector into the box in the directions selected by a periodicity mask
+    /*! \param v Vector to wrap.
+     *  \param periodic 1 in each periodic direction and 0 otherwise.
+     *  \returns The wrapped vector.
+     */
+    vec3<float> wrapMasked(const vec3<float>& v, const vec3<float>& periodic) const
+    {
+        // Subtract the image index in every direction, masked by periodicity,
+        // so that the number of images to remove never affects control flow.
+        vec3<float> v_frac = makeFractional(v);
+        v_frac.x -= periodic.x * wrapImage(v_frac.x);
+        v_frac.y -= periodic.y * wrapImage(v_frac.y);
+        v_frac.z -= periodic.z * wrapImage(v_frac.z);
+        return makeAbsolute(v_frac);
+    }
+
     vec3<float> m_lo;      //!< Minimum coords in the box
     vec3<float> m_hi;      //!< Maximum coords in the box
     vec3<float> m_L;       //!< L precomputed (used to avoid subtractions in boundary conditions)
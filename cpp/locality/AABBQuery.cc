@@ -43,9 +43,22 @@ void AABBQuery::setupTree(unsigned int Np)
     m_aabbs.resize(Np);
 }
 
-void AABBQuery::buildTree(const vec3<float>* points, unsigned int Np)
+void AABBQuery::update(const vec3<float>* points, unsigned int n_points)
+{
+    if (n_points != m_n_points)
+    {
+        throw std::invalid_argument("The number of points must match the number used to build the tree.");
+    }
+
+    validatePoints2D(points, n_points);
+
+    m_points = points;
+    computeAABBs(points, n_points);
+    m_aabb_tree.refit(m_aabbs.data());
+}
+
+void AABBQuery::computeAABBs(const vec3<float>* points, unsigned int Np)
 {
-    // Construct a point AABB for each point
     for (unsigned int i = 0; i < Np; ++i)
     {
         // Make a point AABB
@@ -56,6 +69,12 @@ void AABBQuery::buildTree(const vec3<float>* points, unsigned int Np)
         }
         m_aabbs[i] = AABB(my_pos, i);
     }
+}
+
+void AABBQuery::buildTree(const vec3<float>* points, unsigned int Np)
+{
+    // Construct a point AABB for each point
+    computeAABBs(points, Np);
 
     // Call the tree build routine, one tree per type
     m_aabb_tree.buildTree(m_aabbs.data(), Np);
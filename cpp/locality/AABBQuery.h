@@ -41,6 +41,17 @@ public:
     //! Destructor
     ~AABBQuery() override;
 
+    //! Move the points and refit the existing tree to their new positions.
+    /*! The tree topology is kept, so this is much cheaper than building a new
+     *  AABBQuery but only remains efficient while the points stay close to
+     *  the positions the tree was built from.
+     *
+     *  \param points The new point coordinates.
+     *  \param n_points The number of points, which must match the number the
+     *         tree was built with.
+     */
+    void update(const vec3<float>* points, unsigned int n_points);
+
     //! Implementation of per-particle query for AABBQuery (see NeighborQuery.h for documentation).
     /*! \param query_point The point to find neighbors for.
      *  \param n_query_points The number of query points.
@@ -107,6 +118,9 @@ private:
     //! Maps particles by local id to their id within their type trees
     void mapParticlesByType();
 
+    //! Compute a point AABB for each point
+    void computeAABBs(const vec3<float>* points, unsigned int N);
+
     //! Driver to build AABB trees
     void buildTree(const vec3<float>* points, unsigned int N);
 
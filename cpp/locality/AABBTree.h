@@ -67,6 +67,8 @@ struct CACHE_ALIGN AABBNode
    tree topology is left unchanged. Runs in O(log N) time. AABBs are not saved for all particles, so an update
    will only increase the volume of nodes. The tree should be rebuilt periodically instead of continually
    updated.
+    - Refit : Recompute the AABBs of all nodes for a new set of particle AABBs, keeping the tree topology.
+   Runs in O(N) time and is cheaper than a rebuild when particles have moved only slightly.
     - buildTree : build an efficiently arranged tree given a complete set of AABBs, one for each particle.
 
     **Implementation details**
@@ -164,6 +166,9 @@ public:
     //! Update the AABB of a particle
     inline void update(unsigned int idx, const AABB& aabb);
 
+    //! Recompute the AABBs of all nodes without changing the tree topology
+    inline void refit(const AABB* aabbs);
+
     //! Get the height of a given particle's leaf node
     inline unsigned int height(unsigned int idx);
 
@@ -349,6 +354,40 @@ inline void AABBTree::update(unsigned int idx, const AABB& aabb)
     }
 }
 
+/*! \param aabbs New AABBs for each particle, indexed by particle index
+
+    Recompute the AABB of every node from scratch in a single bottom-up pass. Leaf nodes enclose the new AABBs
+   of their particles and internal nodes enclose their children. Unlike update(), node volumes can shrink as
+   well as grow, so the tree remains tight as particles move. The topology is left unchanged, so query
+   performance degrades if particles move far from their original neighbors. Runs in O(N) time.
+*/
+inline void AABBTree::refit(const AABB* aabbs)
+{
+    // Nodes are stored in pre-order, so children always follow their parent and
+    // iterating in reverse visits every child before its parent.
+    for (unsigned int node_idx = m_num_nodes; node_idx-- > 0;)
+    {
+        AABBNode& node = m_nodes[node_idx];
+        if (node.left == INVALID_NODE)
+        {
+            if (node.num_particles == 0)
+            {
+                continue;
+            }
+            AABB leaf_aabb = aabbs[node.particles[0]];
+            for (unsigned int j = 1; j < node.num_particles; j++)
+            {
+                leaf_aabb = merge(leaf_aabb, aabbs[node.particles[j]]);
+            }
+            node.aabb = leaf_aabb;
+        }
+        else
+        {
+            node.aabb = merge(m_nodes[node.left].aabb, m_nodes[node.right].aabb);
+        }
+    }
+}
+
 /*! \param idx Particle to get height for
     \returns Height of the node
 */
@@ -4,7 +4,9 @@
 #ifndef NEIGHBOR_QUERY_H
 #define NEIGHBOR_QUERY_H
 
+#include <cstdint>
 #include <memory>
+#include <numeric>
 #include <stdexcept>
 #include <tbb/enumerable_thread_specific.h>
 #include <tbb/parallel_sort.h>
@@ -89,17 +91,7 @@ public:
             throw std::invalid_argument("Cannot create a NeighborQuery with 0 particles.");
         }
 
-        // For 2D systems, check if any z-coordinates are outside some tolerance of z=0
-        if (m_box.is2D())
-        {
-            for (unsigned int i(0); i < n_points; i++)
-            {
-                if (std::abs(m_points[i].z) > 1e-6)
-                {
-                    throw std::invalid_argument("A point with z != 0 was provided in a 2D box.");
-                }
-            }
-        }
+        validatePoints2D(m_points, m_n_points);
     }
 
     //! Empty Destructor
@@ -217,6 +209,25 @@ protected:
         }
     }
 
+    //! Check that points lie in the z=0 plane if the box is 2D.
+    /*! \param points The points to check.
+     *  \param n_points The number of points.
+     */
+    void validatePoints2D(const vec3<float>* points, unsigned int n_points) const
+    {
+        // For 2D systems, check if any z-coordinates are outside some tolerance of z=0
+        if (m_box.is2D())
+        {
+            for (unsigned int i(0); i < n_points; i++)
+            {
+                if (std::abs(points[i].z) > 1e-6)
+                {
+                    throw std::invalid_argument("A point with z != 0 was provided in a 2D box.");
+                }
+            }
+        }
+    }
+
     //! Try to determine the query mode if one is not specified.
     /*! If no mode is specified and a number of neighbors is specified, the
      *  query mode must be a nearest neighbors query (all other arguments can
@@ -312,6 +323,12 @@ protected:
 class NeighborQueryIterator
 {
 public:
+    //! Minimum number of consecutive query points handled by one task in toNeighborList.
+    static constexpr size_t QUERY_TILE_SIZE = 64;
+
+    //! Minimum number of query points for which toNeighborList sorts the query points spatially.
+    static constexpr unsigned int MIN_SORTED_QUERY_POINTS = 1024;
+
     //! Constructor
     NeighborQueryIterator(const NeighborQuery* neighbor_query, const vec3<float>* query_points,
                           unsigned int num_query_points, QueryArgs& qargs)
@@ -383,24 +400,32 @@ public:
     {
         using BondVector = tbb::enumerable_thread_specific<std::vector<NeighborBond>>;
         BondVector bonds;
-        util::forLoopWrapper(0, m_num_query_points, [&](size_t begin, size_t end) {
-            BondVector::reference local_bonds(bonds.local());
-            NeighborBond nb;
-            for (size_t i = begin; i < end; ++i)
-            {
-                std::shared_ptr<NeighborQueryPerPointIterator> it = this->query(i);
-                while (!it->end())
+        // Query points are processed in contiguous tiles of a spatially
+        // sorted order so that each task reuses the parts of the search
+        // structure loaded by the previous query points, rather than being
+        // split down to single points.
+        const std::vector<unsigned int> query_order = getQueryOrder();
+        util::forLoopWrapper(
+            0, m_num_query_points,
+            [&](size_t begin, size_t end) {
+                BondVector::reference local_bonds(bonds.local());
+                NeighborBond nb;
+                for (size_t k = begin; k < end; ++k)
                 {
-                    nb = it->next();
-                    // If we're excluding ii bonds, we have to check before adding.
-                    if (nb != ITERATOR_TERMINATOR)
+                    std::shared_ptr<NeighborQueryPerPointIterator> it = this->query(query_order[k]);
+                    while (!it->end())
                     {
-                        local_bonds.emplace_back(nb.getQueryPointIdx(), nb.getPointIdx(), nb.getWeight(),
-                                                 nb.getVector());
+                        nb = it->next();
+                        // If we're excluding ii bonds, we have to check before adding.
+                        if (nb != ITERATOR_TERMINATOR)
+                        {
+                            local_bonds.emplace_back(nb.getQueryPointIdx(), nb.getPointIdx(), nb.getWeight(),
+                                                     nb.getVector());
+                        }
                     }
                 }
-            }
-        });
+            },
+            true, QUERY_TILE_SIZE);
 
         tbb::flattened2d<BondVector> flat_bonds = tbb::flatten2d(bonds);
         std::vector<NeighborBond> linear_bonds(flat_bonds.begin(), flat_bonds.end());
@@ -429,6 +454,40 @@ public:
     }
 
 protected:
+    //! Get the order in which toNeighborList processes the query points.
+    /*! Large sets of query points are visited in Morton order of their
+     *  fractional coordinates in the box, so that consecutive query points
+     *  lie close together and traverse the same parts of the search
+     *  structure. The order does not affect the resulting NeighborList since
+     *  the bonds are sorted afterwards.
+     */
+    std::vector<unsigned int> getQueryOrder() const
+    {
+        std::vector<unsigned int> order(m_num_query_points);
+        std::iota(order.begin(), order.end(), 0);
+        if (m_num_query_points < MIN_SORTED_QUERY_POINTS)
+        {
+            return order;
+        }
+
+        const box::Box& box = m_neighbor_query->getBox();
+        constexpr float max_coord = float((1 << 21) - 1);
+        std::vector<uint64_t> codes(m_num_query_points);
+        util::forLoopWrapper(0, m_num_query_points, [&](size_t begin, size_t end) {
+            for (size_t i = begin; i < end; ++i)
+            {
+                // Query points outside the box are clamped onto its faces.
+                const vec3<float> f = box.makeFractional(m_query_points[i]);
+                codes[i] = util::mortonCode(static_cast<uint64_t>(util::clamp(f.x, 0, 1) * max_coord),
+                                            static_cast<uint64_t>(util::clamp(f.y, 0, 1) * max_coord),
+                                            static_cast<uint64_t>(util::clamp(f.z, 0, 1) * max_coord));
+            }
+        });
+        tbb::parallel_sort(order.begin(), order.end(),
+                           [&codes](unsigned int i, unsigned int j) { return codes[i] < codes[j]; });
+        return order;
+    }
+
     const NeighborQuery* m_neighbor_query;                 //!< Link to the NeighborQuery object.
     const vec3<float>* m_query_points;                     //!< Coordinates of the query points.
     unsigned int m_num_query_points;                       //!< The number of query points.
@@ -1,12 +1,12 @@
 // Copyright (c) 2010-2024 The Regents of the University of Michigan
 // This file is from the freud project, released under the BSD 3-Clause License.
 
+#include <algorithm>
 #include <cmath>
-#include <functional>
-#include <numeric>
+#include <vector>
 
 #include "ContinuousCoordination.h"
-#include "NeighborComputeFunctional.h"
+#include "utils.h"
 
 /*! \file ContinuousCoordination.cc
     \brief Routines for computing local density around a point.
@@ -14,9 +14,38 @@
 
 namespace freud { namespace order {
 
+// Raise base to a non-negative integer power by repeated squaring. This is
+// much cheaper than std::pow for the small integer powers typically used
+// (e.g. four multiplications for a power of 8).
+inline float ipow(float base, unsigned int p)
+{
+    float val {1};
+    while (p != 0)
+    {
+        if ((p & 1U) != 0)
+        {
+            val *= base;
+        }
+        p >>= 1U;
+        if (p != 0)
+        {
+            base *= base;
+        }
+    }
+    return val;
+}
+
 ContinuousCoordination::ContinuousCoordination(std::vector<float> powers, bool compute_log, bool compute_exp)
     : m_powers(std::move(powers)), m_compute_exp(compute_exp), m_compute_log(compute_log)
-{}
+{
+    m_integer_powers.reserve(m_powers.size());
+    for (const float power : m_powers)
+    {
+        // Large powers are left to std::pow, where repeated squaring has no advantage.
+        const bool is_integer = power >= 0 && power <= 64 && power == std::floor(power);
+        m_integer_powers.push_back(is_integer ? static_cast<int>(power) : -1);
+    }
+}
 
 void ContinuousCoordination::compute(const freud::locality::Voronoi* voronoi)
 {
@@ -25,50 +54,67 @@ void ContinuousCoordination::compute(const freud::locality::Voronoi* voronoi)
     m_coordination.prepare({num_points, getNumberOfCoordinations()});
     const auto& volumes = voronoi->getVolumes();
     const auto& num_neighbors = nlist->getCounts();
+    const auto& segments = nlist->getSegments();
+    const auto& weights = nlist->getWeights();
+    const auto& distances = nlist->getDistances();
     // This is necessary as the current Windows runners on GitHub actions have a
     // compiler that doesn't support *this capture in lambdas. Thus, we need a
     // reference to powers directly.
     const auto& powers = getPowers();
+    const auto& integer_powers = m_integer_powers;
     // 2 for triangles 3 for pyramids
     const float volume_prefactor = voronoi->getBox().is2D() ? 2.0 : 3.0;
-    freud::locality::loopOverNeighborListIterator(
-        nlist.get(),
-        [&](size_t particle_index, const std::shared_ptr<freud::locality::NeighborPerPointIterator>& ppiter) {
+    util::forLoopWrapper(0, num_points, [&](size_t begin, size_t end) {
+        // All coordination numbers are accumulated in a single pass over each
+        // particle's neighbors rather than one pass per coordination number.
+        std::vector<float> power_sums(powers.size());
+        for (size_t particle_index = begin; particle_index < end; ++particle_index)
+        {
             // 1/2 comes from the distance vector since we want to measure from the pyramid
             // base to the center.
             const float prefactor
                 = 1.0F / (volume_prefactor * 2.0F * static_cast<float>(volumes[particle_index]));
-            std::vector<float> i_volumes;
-            for (freud::locality::NeighborBond nb = ppiter->next(); !ppiter->end(); nb = ppiter->next())
+            const float num_neighbors_i {static_cast<float>(num_neighbors[particle_index])};
+            const float exp_shift {1.0F / num_neighbors_i};
+            std::fill(power_sums.begin(), power_sums.end(), 0.0F);
+            float log_sum {0};
+            float exp_sum {0};
+            const size_t bonds_begin = segments[particle_index];
+            const size_t bonds_end = bonds_begin + num_neighbors[particle_index];
+            for (size_t bond = bonds_begin; bond < bonds_end; ++bond)
             {
-                i_volumes.emplace_back(prefactor * nb.getWeight() * nb.getDistance());
+                const float volume = prefactor * weights[bond] * distances[bond];
+                for (size_t k {0}; k < powers.size(); ++k)
+                {
+                    power_sums[k] += (integer_powers[k] >= 0)
+                        ? ipow(volume, static_cast<unsigned int>(integer_powers[k]))
+                        : std::pow(volume, powers[k]);
+                }
+                if (m_compute_log)
+                {
+                    log_sum += std::log(volume);
+                }
+                if (m_compute_exp)
+                {
+                    exp_sum += std::exp(volume - exp_shift);
+                }
             }
             size_t coordination_number {0};
-            float num_neighbors_i {static_cast<float>(num_neighbors[particle_index])};
             for (size_t k {0}; k < powers.size(); ++k)
             {
-                float coordination = std::transform_reduce(
-                    i_volumes.begin(), i_volumes.end(), 0.0F, std::plus<>(),
-                    [&powers, k](const auto& volume) { return std::pow(volume, powers[k]); });
                 m_coordination(particle_index, coordination_number++)
-                    = std::pow(num_neighbors_i, 2.0F - powers[k]) / coordination;
+                    = std::pow(num_neighbors_i, 2.0F - powers[k]) / power_sums[k];
             }
             if (m_compute_log)
             {
-                float coordination
-                    = std::transform_reduce(i_volumes.begin(), i_volumes.end(), 0.0F, std::plus<>(), logf);
-                m_coordination(particle_index, coordination_number++)
-                    = -coordination / std::log(num_neighbors_i);
+                m_coordination(particle_index, coordination_number++) = -log_sum / std::log(num_neighbors_i);
             }
             if (m_compute_exp)
             {
-                m_coordination(particle_index, coordination_number) = std::transform_reduce(
-                    i_volumes.begin(), i_volumes.end(), 0.0F, std::plus<>(),
-                    [num_neighbors_i](const auto& volume) {
-                        return std::exp(volume - (1.0F / static_cast<float>(num_neighbors_i)));
-                    });
+                m_coordination(particle_index, coordination_number) = exp_sum;
             }
-        });
+        }
+    });
 }
 
 unsigned int ContinuousCoordination::getNumberOfCoordinations() const
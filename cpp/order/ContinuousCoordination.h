@@ -54,6 +54,7 @@ public:
 
 private:
     std::vector<float> m_powers;              //!< The powers to use for CNv
+    std::vector<int> m_integer_powers;        //!< m_powers as integers, -1 where not a non-negative integer
     bool m_compute_log;                       //!< Whether to compute CNlog
     bool m_compute_exp;                       //!< Whether to compute CNexp
     util::ManagedArray<float> m_coordination; //!< number of neighbors array computed
@@ -12,6 +12,7 @@
 namespace freud { namespace parallel {
 
 std::unique_ptr<tbb::global_control> tbb_thread_control;
+unsigned int tbb_num_threads = 0; //!< Number of threads allowed by tbb_thread_control
 
 /*! \param N Number of threads to use for TBB computations
 
@@ -27,9 +28,18 @@ void setNumThreads(unsigned int N)
         N = std::thread::hardware_concurrency();
     }
 
+    // Replacing the global_control resets the TBB scheduler, so skip it when
+    // the limit is unchanged (e.g. entering a NumThreads context that
+    // requests the current number of threads).
+    if (tbb_thread_control && N == tbb_num_threads)
+    {
+        return;
+    }
+
     // then recreate it
     tbb_thread_control
         = std::make_unique<tbb::global_control>(tbb::global_control::parameter::max_allowed_parallelism, N);
+    tbb_num_threads = N;
 }
 
 }; }; // end namespace freud::parallel
@@ -6,6 +6,7 @@
 
 #include <algorithm>
 #include <cmath>
+#include <cstdint>
 #include <tbb/blocked_range.h>
 #include <tbb/blocked_range2d.h>
 #include <tbb/parallel_for.h>
@@ -43,18 +44,46 @@ template<typename Scalar> inline Scalar sinc(Scalar x)
     return std::sin(x) / x;
 }
 
+//! Spread the bits of a 21-bit integer so that two zero bits separate each bit.
+/*! \param v Integer to spread out (only the lowest 21 bits are used).
+    \returns v with two zero bits inserted between each of its bits.
+*/
+inline uint64_t expandMortonBits(uint64_t v)
+{
+    v &= 0x1fffff;
+    v = (v | (v << 32)) & 0x1f00000000ffff;
+    v = (v | (v << 16)) & 0x1f0000ff0000ff;
+    v = (v | (v << 8)) & 0x100f00f00f00f00f;
+    v = (v | (v << 4)) & 0x10c30c30c30c30c3;
+    v = (v | (v << 2)) & 0x1249249249249249;
+    return v;
+}
+
+//! Compute the 63-bit Morton (Z-order) code of a point on a 21-bit integer grid.
+/*! \param x Integer x coordinate.
+    \param y Integer y coordinate.
+    \param z Integer z coordinate.
+    \returns The bits of x, y, and z interleaved.
+*/
+inline uint64_t mortonCode(uint64_t x, uint64_t y, uint64_t z)
+{
+    return expandMortonBits(x) | (expandMortonBits(y) << 1) | (expandMortonBits(z) << 2);
+}
+
 //! Wrapper for for-loop to allow the execution in parallel or not.
 /*! \param begin Beginning index.
  *  \param end Ending index.
  *  \param body An object with operator(size_t begin, size_t end).
  *  \param parallel If true, run body in parallel.
+ *  \param grain_size Minimum number of consecutive indices processed together by one task.
  */
 template<typename Body>
-inline void forLoopWrapper(size_t begin, size_t end, const Body& body, bool parallel = true)
+inline void forLoopWrapper(size_t begin, size_t end, const Body& body, bool parallel = true,
+                           size_t grain_size = 1)
 {
     if (parallel)
     {
-        tbb::parallel_for(tbb::blocked_range<size_t>(begin, end),
+        tbb::parallel_for(tbb::blocked_range<size_t>(begin, end, grain_size),
                           [&body](const tbb::blocked_range<size_t>& r) { body(r.begin(), r.end()); });
     }
     else
@@ -115,6 +115,7 @@ cdef extern from "AABBQuery.h" namespace "freud::locality":
         AABBQuery(const freud._box.Box,
                   const vec3[float]*,
                   unsigned int) except +
+        void update(const vec3[float]*, unsigned int) except +
 
 cdef extern from "BondHistogramCompute.h" namespace "freud::locality":
     cdef cppclass BondHistogramCompute:
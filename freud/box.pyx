@@ -403,7 +403,7 @@ cdef class Box:
             >>> np.mean(points, axis=0)  # Does not account for periodic images
             array([0., 0., 0.])
             >>> box.center_of_mass(points)  # Accounts for periodic images
-            array([-0.1845932,  0.       ,  0.       ])
+            array([-0.18459368,  0.        ,  0.        ])
 
         Args:
             vecs (:math:`\left(N, 3\right)` :class:`numpy.ndarray`):
@@ -443,8 +443,8 @@ cdef class Box:
             >>> box = freud.Box.cube(10)
             >>> points = [[-1, -1, 0], [-1, 1, 0], [2, 0, 0]]
             >>> box.center(points)
-            array([[-0.8154068, -1.0000002,  0.       ],
-                   [-0.8154068,  1.       ,  0.       ],
+            array([[-0.8154063, -1.       ,  0.       ],
+                   [-0.8154063,  1.       ,  0.       ],
                    [ 2.1845937,  0.       ,  0.       ]], dtype=float32)
 
         Args:
@@ -685,9 +685,17 @@ cdef class Box:
         Returns:
             :math:`\left(3, 3\right)` :class:`numpy.ndarray`: Box matrix
         """
-        return np.asarray([[self.Lx, self.xy * self.Ly, self.xz * self.Lz],
-                           [0, self.Ly, self.yz * self.Lz],
-                           [0, 0, self.Lz]])
+        # Read the box parameters directly instead of through the Python
+        # properties, since this is called frequently (e.g. by the v1, v2,
+        # and v3 properties).
+        cdef vec3[float] L = self.thisptr.getL()
+        cdef double Lx = L.x, Ly = L.y, Lz = L.z
+        cdef double xy = self.thisptr.getTiltFactorXY()
+        cdef double xz = self.thisptr.getTiltFactorXZ()
+        cdef double yz = self.thisptr.getTiltFactorYZ()
+        return np.asarray([[Lx, xy * Ly, xz * Lz],
+                           [0, Ly, yz * Lz],
+                           [0, 0, Lz]])
 
     def to_box_lengths_and_angles(self):
         r"""Return the box lengths and angles.
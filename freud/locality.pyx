@@ -410,6 +410,31 @@ cdef class NeighborQuery:
         cdef _QueryArgs args = _QueryArgs.from_dict(query_args)
         return NeighborQueryResult.init(self, query_points, args)
 
+    def query_self(self, query_args):
+        r"""Query for neighbors of the points in this data structure.
+
+        This is equivalent to calling :meth:`~.query` with :attr:`~.points`
+        as the query points and ``exclude_ii=True``.
+
+        Args:
+            query_args (dict):
+                Query arguments determining how to find neighbors. For
+                information on valid query argument, see the `Query API
+                <https://freud.readthedocs.io/en/stable/topics/querying.html>`_.
+                ``exclude_ii`` is always :code:`True` and may not be set to
+                :code:`False`.
+
+        Returns:
+            :class:`~.NeighborQueryResult`: Results object containing the
+            output of this query.
+        """
+        cdef _QueryArgs args
+        if not query_args.get("exclude_ii", True):
+            raise ValueError("exclude_ii cannot be disabled for self queries.")
+        args = _QueryArgs.from_dict(query_args)
+        args.exclude_ii = True
+        return NeighborQueryResult.init(self, self.points, args)
+
     cdef freud._locality.NeighborQuery * get_ptr(self):
         r"""Returns a pointer to the raw C++ object we are wrapping."""
         return self.nqptr
@@ -925,6 +950,27 @@ cdef class AABBQuery(NeighborQuery):
         if type(self) is AABBQuery:
             del self.thisptr
 
+    def update_points(self, points):
+        r"""Move the points and refit the existing tree to them.
+
+        The tree is not rebuilt: the bounding boxes of its nodes are
+        recomputed for the new positions while its structure is kept. This is
+        much faster than constructing a new :class:`~.AABBQuery`, but queries
+        slow down as the points drift away from the positions the tree was
+        built with, so the tree should be rebuilt periodically.
+
+        Args:
+            points ((:math:`N`, 3) :class:`numpy.ndarray`):
+                The new point positions, in the same order and with the same
+                number of points as those used to build the tree.
+        """
+        cdef const float[:, ::1] l_points
+        points = freud.util._convert_array(
+            points, shape=(self.points.shape[0], 3)).copy()
+        l_points = points
+        self.thisptr.update(<vec3[float]*> &l_points[0, 0], points.shape[0])
+        self.points = points
+
 
 cdef class LinkCell(NeighborQuery):
     r"""Supports efficiently finding all points in a set within a certain
@@ -34,9 +34,7 @@ class TestBox:
     def test_get_length(self):
         box = freud.box.Box(2, 4, 5, 1, 0, 0)
 
-        npt.assert_allclose(box.Lx, 2, rtol=1e-6)
-        npt.assert_allclose(box.Ly, 4, rtol=1e-6)
-        npt.assert_allclose(box.Lz, 5, rtol=1e-6)
+        npt.assert_allclose([box.Lx, box.Ly, box.Lz], [2, 4, 5], rtol=1e-6)
         npt.assert_allclose(box.L, [2, 4, 5], rtol=1e-6)
         npt.assert_allclose(box.L_inv, [0.5, 0.25, 0.2], rtol=1e-6)
 
@@ -48,9 +46,7 @@ class TestBox:
         box.Ly = 5
         box.Lz = 6
 
-        npt.assert_allclose(box.Lx, 4, rtol=1e-6)
-        npt.assert_allclose(box.Ly, 5, rtol=1e-6)
-        npt.assert_allclose(box.Lz, 6, rtol=1e-6)
+        npt.assert_allclose([box.Lx, box.Ly, box.Lz], [4, 5, 6], rtol=1e-6)
 
         box.L = [7, 8, 9]
         npt.assert_allclose(box.L, [7, 8, 9], rtol=1e-6)
@@ -64,9 +60,7 @@ class TestBox:
     def test_get_tilt_factor(self):
         box = freud.box.Box(2, 2, 2, 1, 2, 3)
 
-        npt.assert_allclose(box.xy, 1, rtol=1e-6)
-        npt.assert_allclose(box.xz, 2, rtol=1e-6)
-        npt.assert_allclose(box.yz, 3, rtol=1e-6)
+        npt.assert_allclose([box.xy, box.xz, box.yz], [1, 2, 3], rtol=1e-6)
 
     def test_set_tilt_factor(self):
         box = freud.box.Box(2, 2, 2, 1, 2, 3)
@@ -74,16 +68,13 @@ class TestBox:
         box.xz = 5
         box.yz = 6
 
-        npt.assert_allclose(box.xy, 4, rtol=1e-6)
-        npt.assert_allclose(box.xz, 5, rtol=1e-6)
-        npt.assert_allclose(box.yz, 6, rtol=1e-6)
+        npt.assert_allclose([box.xy, box.xz, box.yz], [4, 5, 6], rtol=1e-6)
 
     def test_box_volume(self):
         box3d = freud.box.Box(2, 2, 2, 1, 0, 0)
         box2d = freud.box.Box(2, 2, 0, 0, 0, 0, is2D=True)
 
-        npt.assert_allclose(box3d.volume, 8, rtol=1e-6)
-        npt.assert_allclose(box2d.volume, 4, rtol=1e-6)
+        npt.assert_allclose([box3d.volume, box2d.volume], [8, 4], rtol=1e-6)
 
     def test_wrap_single_particle(self):
         box = freud.box.Box(2, 2, 2, 1, 0, 0)
@@ -390,6 +390,21 @@ class NeighborQueryTest:
 
         assert ij1 == ij2
 
+    def test_query_self(self):
+        L = 10
+        N = 100
+        r_max = 2
+        box, points = freud.data.make_random_system(L, N, seed=0)
+        nq = self.build_query_object(box, points, r_max)
+        query_args = dict(r_max=r_max, exclude_ii=True)
+        nlist1 = nq.query(points, query_args).toNeighborList()
+        nlist2 = nq.query_self(dict(r_max=r_max)).toNeighborList()
+        assert nlist_equal(nlist1, nlist2)
+
+        # exclude_ii cannot be disabled for self queries
+        with pytest.raises(ValueError):
+            nq.query_self(dict(r_max=r_max, exclude_ii=False))
+
     @pytest.mark.parametrize("seed", range(10))
     def test_exhaustive_search(self, seed):
         L, r_max, N = (10, 1.999, 32)
@@ -627,6 +642,32 @@ class TestNeighborQueryAABB(NeighborQueryTest):
         nlist2 = abq.query(points, dict(r_max=r_max, exclude_ii=True)).toNeighborList()
         assert nlist_equal(nlist1, nlist2)
 
+    def test_update_points(self):
+        N = 500
+        L = 10
+        r_max = 1
+        box, points = freud.data.make_random_system(L, N, seed=0)
+        aq = freud.locality.AABBQuery(box, points)
+        rng = np.random.default_rng(0)
+        for _ in range(3):
+            points = box.wrap(points + rng.normal(scale=0.2, size=points.shape))
+            aq.update_points(points)
+            npt.assert_allclose(aq.points, points, rtol=1e-6)
+            aq_new = freud.locality.AABBQuery(box, points)
+            for query_args in (
+                dict(r_max=r_max, exclude_ii=True),
+                dict(num_neighbors=6, exclude_ii=True),
+            ):
+                nlist1 = aq.query(points, query_args).toNeighborList()
+                nlist2 = aq_new.query(points, query_args).toNeighborList()
+                assert nlist_equal(nlist1, nlist2)
+
+    def test_update_points_wrong_number(self):
+        box, points = freud.data.make_random_system(10, 10, seed=0)
+        aq = freud.locality.AABBQuery(box, points)
+        with pytest.raises(ValueError):
+            aq.update_points(points[:5])
+
     @pytest.mark.parametrize(
         "r_guess, scale",
         [(r_guess, scale) for r_guess in [0.5, 1, 2] for scale in [1.01, 1.1, 1.3]],
@@ -1,6 +1,7 @@
 # Copyright (c) 2010-2024 The Regents of the University of Michigan
 # This file is from the freud project, released under the BSD 3-Clause License.
 
+import numpy as np
 import numpy.testing as npt
 import pytest
 
@@ -10,13 +11,14 @@ import freud
 class TestContinuousCoordination:
     """Test fixture for ContinuousCoordination"""
 
-    def setup_method(self):
+    @classmethod
+    def setup_class(cls):
         """Initialize a box with randomly placed particles"""
         box_size = 10
         num_points = 1000
-        self.box, self.pos = freud.data.make_random_system(
-            box_size, num_points, seed=123
-        )
+        cls.box, cls.pos = freud.data.make_random_system(box_size, num_points, seed=123)
+
+    def setup_method(self):
         # 0.0 is the same as just counting neighbor and can be used for testing
         self.powers = [0.0, 2.0, 4.0, 8.0]
         self.compute_log = True
@@ -64,6 +66,62 @@ class TestContinuousCoordination:
         self.compute(system)
         npt.assert_allclose(self.coord.coordination, 4.0, rtol=1e-6)
 
+    @staticmethod
+    def reference_coordination(box, voronoi, powers):
+        """Compute power coordination numbers directly with NumPy."""
+        nlist = voronoi.nlist
+        # 2 for triangles 3 for pyramids
+        volume_prefactor = 2.0 if box.is2D else 3.0
+        volumes = np.asarray(voronoi.volumes, dtype=np.float64)
+        pyramid_volumes = (
+            np.asarray(nlist.weights, dtype=np.float64)
+            * np.asarray(nlist.distances, dtype=np.float64)
+            / (volume_prefactor * 2.0 * volumes[nlist.query_point_indices])
+        )
+        num_neighbors = nlist.neighbor_counts.astype(np.float64)
+        return np.stack(
+            [
+                num_neighbors ** (2.0 - power)
+                / np.bincount(
+                    nlist.query_point_indices,
+                    weights=pyramid_volumes**power,
+                    minlength=len(volumes),
+                )
+                for power in powers
+            ],
+            axis=1,
+        )
+
+    def test_non_integer_powers(self):
+        """Test powers computed with std::pow against a NumPy reference"""
+        powers = [1.5, 3.0, 2.25]
+        coord = freud.order.ContinuousCoordination(powers, False, False)
+        self.voronoi.compute((self.box, self.pos))
+        coord.compute(voronoi=self.voronoi)
+        npt.assert_allclose(
+            coord.coordination,
+            self.reference_coordination(self.box, self.voronoi, powers),
+            rtol=1e-4,
+        )
+
+    def test_large_powers(self):
+        """Test powers above the repeated squaring limit against a NumPy
+        reference"""
+        # A honeycomb lattice has only three neighbors per point, so the
+        # large powers below do not underflow in single precision.
+        uc = freud.data.UnitCell(
+            [np.sqrt(3), 3],
+            [[0, 0, 0], [0, 1 / 3, 0], [0.5, 0.5, 0], [0.5, 5 / 6, 0]],
+        )
+        system = uc.generate_system(4)
+        powers = [1.5, 3.0, 70.0]
+        coord = freud.order.ContinuousCoordination(powers, False, False)
+        self.voronoi.compute(system)
+        coord.compute(voronoi=self.voronoi)
+        reference = self.reference_coordination(system[0], self.voronoi, powers)
+        npt.assert_allclose(coord.coordination, reference, rtol=1e-4)
+        npt.assert_allclose(coord.coordination, 3.0, rtol=1e-4)
+
     @pytest.mark.parametrize("args", (([], True, False), ([2.0], False, True)))
     def test_various_coordinates(self, args):
         def get_coord_size(args):